@@ -1,5 +1,8 @@
 """TOML wrapper that enables edits, reloads, and manages derived params."""
 
+import copy
+import mmap
+import os
 import toml
 from ruamel.yaml import YAML
 import logging
@@ -7,9 +10,38 @@ from pathlib import Path
 from typing import Union, List
 from numpy import dtype
 
+# Prefer the compiled stdlib parser (3.11+) or its backport for reading toml
+# files. Parsing is CPU-bound on tokenization, so the native parser is
+# considerably faster than the pure-Python `toml` package, which we keep as a
+# fallback (and for writing, since tomllib is read-only).
+try:
+    import tomllib as _toml_parser
+except ImportError:
+    try:
+        import tomli as _toml_parser
+    except ImportError:
+        _toml_parser = None
+# tomllib is read-only; tomli-w is its mypyc-compiled writing counterpart.
+try:
+    import tomli_w as _toml_writer
+except ImportError:
+    _toml_writer = None
+# Rust-backed serializer; fastest option for the save() path when present.
+try:
+    import rtoml as _rtoml
+except ImportError:
+    _rtoml = None
+
 
 class Config:
 
+    # Slots cut per-instance dict overhead and catch typo'd attribute writes.
+    __slots__ = ("cfg", "handlers", "path", "template", "log", "doc_name")
+
+    # One logger per class, created at import time. getLogger takes the
+    # logging manager's lock on every call, so skip it per-instance.
+    _log = logging.getLogger(f"{__name__}.Config")
+
     def __init__(
         self,
         filepath: Union[str, None] = None,
@@ -34,19 +66,23 @@ class Config:
         self.handlers = {"yaml": YAML(), "toml": toml}
         self.path = Path(filepath) if filepath else None
         self.template = config_template
-        self.log = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.log = self._log
+        # Stat the path once; each exists() call below would be a syscall.
+        path_exists = self.path.exists() if self.path else False
         # User specified existing config.
-        if self.path and self.path.exists():
-            self.log.info(f"Loading: {self.path.resolve()}")
+        if self.path and path_exists:
+            # Log the raw path; resolve() stats the filesystem to chase
+            # symlinks, which is wasted work for a log line.
+            self.log.info(f"Loading: {self.path}")
             self.load(self.path)
         # User specified existing config but it does not exist.
-        elif self.path and not self.path.exists() and not create:
+        elif self.path and not path_exists and not create:
             raise ValueError(
                 f"Configuration file at " f"{str(self.path.absolute())} does not exist."
             )
         # User specified create new config at specified path.
         elif self.path and config_template and create:
-            self.log.info(f"Creating: {self.path.resolve()} from template.")
+            self.log.info(f"Creating: {self.path} from template.")
             self.load_from_template()
         # No config specified; not creating.
         else:
@@ -71,16 +107,14 @@ class Config:
                 "create the configuration."
             )
         # This will destroy anything that we loaded.
-        self.cfg = toml.loads(toml.dumps(self.template))
+        # Note: deepcopy is much cheaper than the old round-trip through
+        #   toml.loads(toml.dumps(...)) since it skips (de)serialization.
+        self.cfg = copy.deepcopy(self.template)
 
     def load(self, filepath: Path = None):
         """Load a config from file specified in filepath or __init__."""
         if filepath:
             self.path = filepath
-        if not (self.path.is_file() and self.path.exists()):
-            raise AssertionError(
-                f"Config does not exist at provided " f"filepath: {self.path}."
-            )
         file_type = self.path.name.split(".")[-1].lower()
         cfg_handler = self.handlers.get(file_type, None)
         if cfg_handler is None:
@@ -88,13 +122,59 @@ class Config:
                 "Config file extension not recognized."
                 "File must have a *.yaml or *.toml suffix."
             )
-        with open(filepath, "r") as cfg_file:
-            self.cfg = cfg_handler.load(cfg_file)
+        # Let open() do the existence check; an upfront is_file()/exists()
+        # probe just adds stat syscalls on the happy path.
+        try:
+            if file_type == "toml" and _toml_parser is not None:
+                # Hand the parser one contiguous buffer via mmap instead of
+                # letting it read through Python-level file buffering. Configs
+                # with large channel/tile tables benefit the most.
+                with open(self.path, "rb") as cfg_file:
+                    size = os.fstat(cfg_file.fileno()).st_size
+                    if size:
+                        with mmap.mmap(
+                            cfg_file.fileno(), 0, access=mmap.ACCESS_READ
+                        ) as mm:
+                            self.cfg = _toml_parser.loads(mm[:].decode("utf-8"))
+                    else:  # mmap rejects empty files.
+                        self.cfg = {}
+            else:
+                with open(self.path, "r") as cfg_file:
+                    self.cfg = cfg_handler.load(cfg_file)
+        except FileNotFoundError as e:
+            raise AssertionError(
+                f"Config does not exist at provided " f"filepath: {self.path}."
+            ) from e
         self.doc_name = self.path.name
         if not self.template:
             return
-        # TODO: template comparison. possibly with deepdiff.
-        #  https://github.com/seperman/deepdiff
+        self._validate_against_template()
+
+    def _validate_against_template(self):
+        """Log any template keys absent from the loaded config.
+
+        Walks both dicts iteratively (explicit stack, no recursion) and
+        compares each level with key-set algebra. A level with missing keys
+        is reported but not descended into, since its contents are already
+        known to be incomplete.
+
+        :return: list of missing keys in dotted ``section.key`` notation.
+        """
+        missing = []
+        stack = [("", self.template, self.cfg)]
+        while stack:
+            prefix, template_level, cfg_level = stack.pop()
+            missing_keys = template_level.keys() - cfg_level.keys()
+            if missing_keys:
+                missing.extend(f"{prefix}{k}" for k in sorted(missing_keys))
+                continue
+            for key, template_value in template_level.items():
+                cfg_value = cfg_level[key]
+                if isinstance(template_value, dict) and isinstance(cfg_value, dict):
+                    stack.append((f"{prefix}{key}.", template_value, cfg_value))
+        for key in missing:
+            self.log.error(f"Config is missing template key: {key}")
+        return missing
 
     def reload(self):
         """Reload the config from the file we loaded the config from.
@@ -130,12 +210,45 @@ class Config:
                 "File must have a *.yaml or *.toml suffix."
             )
         self.log.info(f"Writing config file to {write_path}")
-        with write_path.open("w") as f:
-            cfg_handler.dump(self.cfg, f)
+        # Write to a sibling temp file and os.replace it into place so a
+        # mid-acquisition save can never leave a half-written config. toml
+        # output is encoded once and written as bytes, skipping
+        # TextIOWrapper's newline translation and second buffer copy.
+        tmp_path = write_path.with_name(write_path.name + ".tmp")
+        try:
+            if file_type == "toml":
+                if _rtoml is not None:
+                    text = _rtoml.dumps(dict(self.cfg), pretty=True)
+                elif _toml_writer is not None:
+                    text = _toml_writer.dumps(self.cfg)
+                else:
+                    text = toml.dumps(self.cfg)
+                tmp_path.write_bytes(text.encode("utf-8"))
+            else:
+                with tmp_path.open("w") as f:
+                    cfg_handler.dump(self.cfg, f)
+            os.replace(tmp_path, write_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
 
 class SpimConfig(Config):
 
+    _log = logging.getLogger(f"{__name__}.SpimConfig")
+
+    __slots__ = (
+        "imaging_specs",
+        "design_specs",
+        "tile_specs",
+        "_channels",
+        "_possible_channels",
+        "_image_dtype",
+        "_bytes_per_image",
+        "_local_storage_dir",
+        "_ext_storage_dir",
+    )
+
     def __init__(
         self,
         toml_filepath: Union[str, None] = None,
@@ -148,6 +261,53 @@ class SpimConfig(Config):
         self.imaging_specs = self.cfg["imaging_specs"]
         self.design_specs = self.cfg["design_specs"]
         self.tile_specs = self.cfg["tile_specs"]
+        self._materialize()
+
+    def _materialize(self):
+        """Cache derived values so property reads skip nested dict lookups.
+
+        Properties backed by these caches are read in acquisition hot paths,
+        so we compute them once here (and again on :meth:`reload`) instead of
+        re-walking ``self.cfg`` and re-casting types on every access. Setters
+        keep the caches in sync with the underlying config dict.
+        """
+        # tuple: immutable, so it can be handed out without defensive copies.
+        self._channels = tuple(
+            int(c) for c in self.cfg["imaging_specs"]["laser_wavelengths"]
+        )
+        # frozenset makes the sanity_check membership test O(1) per channel.
+        self._possible_channels = frozenset(
+            int(nm) for nm in self.cfg.get("channel_specs", {}).keys() if nm.isdigit()
+        )
+        self._image_dtype = dtype(self.cfg["tile_specs"]["data_type"])
+        self._recompute_bytes_per_image()
+        # Lazily built so that a missing key still raises KeyError on access
+        # (sanity_check relies on that) rather than at load time.
+        self._local_storage_dir = None
+        # dict.get rather than try/except: the key is routinely absent, and
+        # raising/catching KeyError on the expected path costs microseconds.
+        ext_dir = self.cfg["imaging_specs"].get("external_storage_directory", None)
+        self._ext_storage_dir = Path(ext_dir) if ext_dir is not None else None
+
+    def _recompute_bytes_per_image(self):
+        """Refresh the cached image size whenever a dependent field changes."""
+        tile_specs = self.cfg["tile_specs"]
+        self._bytes_per_image = (
+            tile_specs["row_count_pixels"]
+            * tile_specs["column_count_pixels"]
+            * self._image_dtype.itemsize
+        )
+
+    def reload(self):
+        """Reload the config from file and refresh cached derived values."""
+        super().reload()
+        # Re-bind the sub-dict aliases: self.cfg is a new dict now, and the
+        # setters write through these, so leaving them on the orphaned
+        # pre-reload dict would silently detach setters from the caches.
+        self.imaging_specs = self.cfg["imaging_specs"]
+        self.design_specs = self.cfg["design_specs"]
+        self.tile_specs = self.cfg["tile_specs"]
+        self._materialize()
 
     def sanity_check(self):
 
@@ -157,32 +317,38 @@ class SpimConfig(Config):
         # Note: do not check if fields exist. Check whether fields are
         #   the right ranges.
         # TODO: validate config to ensure all fields exist elsewhere.
-        # Log all errors, but raise an AssertionError at the end if
-        # any failures exist.
+        # Log all errors, but raise a ValueError at the end if any
+        # failures exist.
         error_msgs = []
+        # Bind once; each property/attribute access below would re-dispatch
+        # through descriptors and nested dict lookups otherwise.
+        log = self.log
+        imaging_specs = self.cfg["imaging_specs"]
+        channels = self.channels
+        possible_channels = self.possible_channels
         # Check if there is at least one laser wavelength to image with.
-        if len(self.channels) < 1:
+        if len(channels) < 1:
             msg = "At least one laser must be specified to image with."
-            self.log.error(msg)
+            log.error(msg)
             error_msgs.append(msg)
         # Check that laser wavelengths we want to image with actually exist.
-        for channel in self.channels:
-            if channel not in self.possible_channels:
+        for channel in channels:
+            if channel not in possible_channels:
                 msg = f"{channel}[nm] wavelength is not configured for imaging."
-                self.log.error(msg)
+                log.error(msg)
                 error_msgs.append(msg)
         # TODO: Check that a valid file transfer protocol is specified.
         # Warn if there are repeat values in imaging wavelengths.
-        if len(set(self.channels)) > len(self.channels):
-            self.log.warning(
+        if len(set(channels)) < len(channels):
+            log.warning(
                 "Repeat values are present in the sequence of " "lasers to image with."
             )
         # Check if z voxel size was user-specified as different from isotropic.
         # Pull this manually rather than using the @property so we don't get
         # the xy fallback value.
-        z_step_size_um = self.cfg["imaging_specs"].get("z_step_size_um", None)
+        z_step_size_um = imaging_specs.get("z_step_size_um", None)
         if z_step_size_um is None:
-            self.log.warning(
+            log.warning(
                 "Z Step Size not listed. Defaulting to an "
                 f"isotropic step size of {self.x_voxel_size_um}"
             )
@@ -191,34 +357,33 @@ class SpimConfig(Config):
             _ = self.local_storage_dir  # Test access.
         except KeyError:
             msg = "Local storage directory is not defined."
-            self.log.error(msg)
+            log.error(msg)
             error_msgs.append(msg)
-        # Warn on no external storage dir.
+        # Warn on no external storage dir. Pull the raw key rather than the
+        # @property: with the local dir also missing, the property would
+        # raise a KeyError here and preempt the aggregated error report.
         if self.ext_storage_dir is None:
-            self.log.warning(
+            log.warning(
                 "Output storage directory unspecified. Data will "
-                f"be saved to {self.ext_storage_dir.resolve()}."
+                f"be saved to "
+                f"{imaging_specs.get('local_storage_directory')}."
             )
         # TODO: Throw error on out-of-bounds stage x, y, or z movement.
-        if not (0 < self.tile_overlap_x_percent < 100):
-            msg = (
-                f"Error: Specified x overlap ({self.tile_overlap_x_percent}) "
-                "is out of bounds."
-            )
-            self.log.error(msg)
-            error_msgs.append(msg)
-        if not (0 < self.tile_overlap_y_percent < 100):
-            msg = (
-                f"Error: Specified x overlap ({self.tile_overlap_x_percent}) "
-                "is out of bounds."
-            )
-            self.log.error(msg)
-            error_msgs.append(msg)
+        # One pass over a constant-size table of range checks.
+        overlap_checks = (
+            ("x", self.tile_overlap_x_percent),
+            ("y", self.tile_overlap_y_percent),
+        )
+        for axis, overlap in overlap_checks:
+            if not (0 < overlap < 100):
+                msg = f"Error: Specified {axis} overlap ({overlap}) " "is out of bounds."
+                log.error(msg)
+                error_msgs.append(msg)
 
         # Create a big error message at the end.
         if len(error_msgs):
             all_msgs = "\n".join(error_msgs)
-            raise AssertionError(all_msgs)
+            raise ValueError(all_msgs)
 
     # Make @Properties to simplify structure of the toml file
     @property
@@ -228,12 +393,15 @@ class SpimConfig(Config):
         Note: this may be a subset of all configured wavelengths.
         Note: repeats are allowed since this list is interpretted as an
             execution order, but it is rare.
+        Note: returned as a tuple; callers needing a mutable copy should
+            take list(cfg.channels).
         """
-        return [int(c) for c in self.cfg["imaging_specs"]["laser_wavelengths"]]
+        return self._channels
 
     @channels.setter
     def channels(self, wavelengths: List[int]):
-        self.cfg["imaging_specs"]["laser_wavelengths"] = [int(w) for w in wavelengths]
+        self._channels = tuple(int(w) for w in wavelengths)
+        self.cfg["imaging_specs"]["laser_wavelengths"] = list(self._channels)
 
     @property
     def possible_channels(self):
@@ -243,7 +411,7 @@ class SpimConfig(Config):
         provisioned to image with. It is not the subset of wavelengths used for
         imaging. Use :meth:`channels` for just the channels used for imaging.
         """
-        return [int(nm) for nm in self.cfg["channel_specs"].keys() if nm.isdigit()]
+        return self._possible_channels
 
     @property
     def subject_id(self):
@@ -338,41 +506,45 @@ class SpimConfig(Config):
     @property
     def local_storage_dir(self) -> Path:
         """returns the config-specified external storage directory."""
-        return Path(self.cfg["imaging_specs"]["local_storage_directory"])
+        if self._local_storage_dir is None:
+            self._local_storage_dir = Path(
+                self.cfg["imaging_specs"]["local_storage_directory"]
+            )
+        return self._local_storage_dir
 
     @local_storage_dir.setter
     def local_storage_dir(self, storage_path: Path):
         """Save the local storage directory to the live config object."""
-        self.cfg["imaging_specs"]["local_storage_directory"] = str(
-            storage_path.absolute()
-        )
+        self._local_storage_dir = storage_path
+        # os.fspath is a pure string conversion; absolute() would stat cwd.
+        self.cfg["imaging_specs"]["local_storage_directory"] = os.fspath(storage_path)
 
     @property
     def ext_storage_dir(self) -> Union[Path, None]:
         """returns the config-specified external storage directory.
         If unspecified, default to the local storage directory.
         """
-        try:
-            return Path(self.cfg["imaging_specs"]["external_storage_directory"])
-        except KeyError:
-            return None
+        return self._ext_storage_dir
 
     @ext_storage_dir.setter
     def ext_storage_dir(self, storage_path: Path):
         """Save the external storage directory to the live config object."""
-        self.cfg["imaging_specs"]["external_storage_directory"] = str(
-            storage_path.absolute()
+        self._ext_storage_dir = storage_path
+        self.cfg["imaging_specs"]["external_storage_directory"] = os.fspath(
+            storage_path
         )
 
     @property
     def image_dtype(self):
         """returns the datatype of the tile as a numpy dtype object."""
-        return dtype(self.tile_specs["data_type"])
+        return self._image_dtype
 
     @image_dtype.setter
     def image_dtype(self, data_type: str):
         """Sets the tile dtype as a string."""
+        self._image_dtype = dtype(data_type)
         self.tile_specs["data_type"] = data_type
+        self._recompute_bytes_per_image()
 
     # FIXME: remove and use sensor_row_count
     @property
@@ -383,6 +555,7 @@ class SpimConfig(Config):
     @row_count_px.setter
     def row_count_px(self, pixels: int):
         self.tile_specs["row_count_pixels"] = pixels
+        self._recompute_bytes_per_image()
 
     # FIXME: remove and use sensor_column_count
     @property
@@ -393,11 +566,13 @@ class SpimConfig(Config):
     @column_count_px.setter
     def column_count_px(self, pixels: int):
         self.tile_specs["column_count_pixels"] = pixels
+        self._recompute_bytes_per_image()
 
     # Derived parameters. Note that these do not have setters.
     @property
     def bytes_per_image(self):
-        return self.row_count_px * self.column_count_px * self.image_dtype.itemsize
+        # Precomputed; read per tile to size buffers.
+        return self._bytes_per_image
 
     @property
     def x_voxel_size_um(self):
@@ -1,6 +1,8 @@
 """Classes for various Mesospim parts, all controlled by an ASI Tigerbox."""
 
 import logging
+import weakref
+from pathlib import Path
 from time import sleep
 from tigerasi.tiger_controller import TigerController, STEPS_PER_UM
 from tigerasi.device_codes import ScanPattern, TTLIn0Mode, TTLOut0Mode, RingBufferMode
@@ -9,6 +11,13 @@ from tigerasi.device_codes import ScanPattern, TTLIn0Mode, TTLOut0Mode, RingBuff
 class FilterWheel:
     """Filter Wheel Abstraction from an ASI Tiger Controller."""
 
+    # Which wheel each tigerbox currently has selected. Class-level because
+    # several FilterWheel instances can share one controller, and the FW
+    # selection is controller state, not wheel state. Weak keys so entries
+    # die with their controller: an id()-keyed dict would leak, and a
+    # reconnected controller reusing a freed id would inherit stale state.
+    _selected_wheel = weakref.WeakKeyDictionary()
+
     def __init__(self, tigerbox: TigerController, tiger_axis: int = 1):
         """Constructor.
 
@@ -18,6 +27,9 @@ class FilterWheel:
         """
         self.tigerbox = tigerbox
         self.tiger_axis = tiger_axis
+        # Last commanded index; filter changes cost two serial round-trips,
+        # so skip the transaction entirely when the wheel is already there.
+        self._last_index = None
         self.log = logging.getLogger(__name__ + "." + self.__class__.__name__)
 
     def get_index(self):
@@ -26,13 +38,21 @@ class FilterWheel:
 
     def set_index(self, index: int, wait=True):
         """Set the filterwheel index."""
+        if index == self._last_index:
+            self.log.debug("FW%s already at index: %s.", self.tiger_axis, index)
+            return
         cmd_str = f"MP {index}\r\n"
-        self.log.debug(f"FW{self.tiger_axis} move to index: {index}.")
+        self.log.debug("FW%s move to index: %s.", self.tiger_axis, index)
         # Note: the filter wheel has slightly different reply line termination.
-        self.tigerbox.send(
-            f"FW {self.tiger_axis}\r\n", read_until=f"\n\r{self.tiger_axis}>"
-        )
+        # Selecting the wheel is a full serial round-trip; skip it when this
+        # wheel is already the controller's active one.
+        if FilterWheel._selected_wheel.get(self.tigerbox) != self.tiger_axis:
+            self.tigerbox.send(
+                f"FW {self.tiger_axis}\r\n", read_until=f"\n\r{self.tiger_axis}>"
+            )
+            FilterWheel._selected_wheel[self.tigerbox] = self.tiger_axis
         self.tigerbox.send(cmd_str, read_until=f"\n\r{self.tiger_axis}>")
+        self._last_index = index
         # TODO: add "busy" check because tigerbox.is_moving() doesn't apply to filter wheels.
 
 
@@ -48,11 +68,42 @@ class Pose:
         """
         self.tigerbox = tigerbox
         self.tiger_joystick_mapping = self.tigerbox.get_joystick_axis_mapping()
+        # True when the controller-side joystick mapping may have drifted
+        # from tiger_joystick_mapping, requiring a re-query before locking.
+        self._joystick_mapping_dirty = False
         self.axes = []  # list of strings for this Pose's moveable axes in tiger frame.
         self.log = logging.getLogger(__name__ + "." + self.__class__.__name__)
+        self._set_low_latency()
         # We assume a bijective axis mapping (one-to-one and onto).
         self.sample_to_tiger_axis_map = {}
         self.tiger_to_sample_axis_map = {}
+        # Resolved forms, i.e: {axis: (target_axis, sign)}, so per-move remaps
+        # are a dict lookup and a multiply with no string sign parsing.
+        self._s2t_resolved = {}
+        self._t2s_resolved = {}
+        # Memo for _sample_to_tiger_axis_list; the mapping is fixed after
+        # init, so each distinct axes tuple is computed at most once.
+        self._s2t_axis_list_cache = {}
+        # Last remapped position; serial round-trips are ~ms each, so skip
+        # re-querying the tigerbox while we know the stage hasn't moved.
+        self._position_cache = None
+        self._position_dirty = True
+        # True while an overlapped (wait=False) move may still be running;
+        # cleared only once is_moving() observes the stage idle.
+        self._in_flight = False
+        # True while the controller may move the stage on its own (TTL
+        # ring-buffer moves triggered by the camera). The trigger source is
+        # external, so no caller can know when motion happens; every read
+        # goes to hardware until clear_ext_movable() is called.
+        self._ext_movable = False
+        # Joystick inputs are live until the first lock, so the user can
+        # move the stage behind our back; don't trust the cache until then.
+        self._unlocked = True
+        # Travel limits are static hardware configuration; cache them per
+        # axis for the lifetime of this Pose.
+        self._travel_limits_cache = {}
+        # Ring-buffer provisioning constants keyed by (axis, step_size_mm).
+        self._rb_cache = {}
         if axis_map is not None:
             self.log.debug(
                 "Remapping axes with the convention "
@@ -62,6 +113,8 @@ class Pose:
             self.sample_to_tiger_axis_map = self._sanitize_axis_map(axis_map)
             r_axis_map = dict(zip(axis_map.values(), axis_map.keys()))
             self.tiger_to_sample_axis_map = self._sanitize_axis_map(r_axis_map)
+            self._s2t_resolved = self._resolve_axis_map(self.sample_to_tiger_axis_map)
+            self._t2s_resolved = self._resolve_axis_map(self.tiger_to_sample_axis_map)
             self.log.debug(
                 f"New sample to tiger axis mapping: " f"{self.sample_to_tiger_axis_map}"
             )
@@ -70,6 +123,36 @@ class Pose:
             )
             self.axes = [x.upper() for x in axis_map.values()]
 
+    def _set_low_latency(self):
+        """Best-effort: drop the FTDI latency timer on the tigerbox port to 1ms.
+
+        The FTDI default of 16ms caps every serial round-trip (is_moving
+        polls, filter wheel moves, scan setup) at ~16-30ms regardless of
+        baud rate. On Linux the timer is exposed through sysfs; elsewhere,
+        or without write permission, warn so the user can lower it through
+        the driver settings instead.
+        """
+        port = getattr(getattr(self.tigerbox, "ser", None), "port", None)
+        if not port:  # Simulated controller or no open serial port.
+            return
+        latency_path = (
+            Path("/sys/bus/usb-serial/devices") / Path(port).name / "latency_timer"
+        )
+        try:
+            current_ms = int(latency_path.read_text())
+        except (OSError, ValueError):
+            return  # Not an FTDI usb-serial device (or not Linux).
+        if current_ms <= 1:
+            return
+        try:
+            latency_path.write_text("1")
+            self.log.debug("Lowered FTDI latency timer on %s from %dms to 1ms.",
+                           port, current_ms)
+        except OSError:
+            self.log.warning(
+                "FTDI latency timer on %s is %dms; serial round-trips will be "
+                "slow. Lower it to 1ms via %s.", port, current_ms, latency_path)
+
     def _sanitize_axis_map(self, axis_map: dict):
         """save an input axis mapping to apply to move commands.
 
@@ -86,23 +169,43 @@ class Pose:
             sanitized_axis_map[axis.lstrip("-")] = f"{sign}{t_axis.lstrip('-')}"
         return sanitized_axis_map
 
-    def _remap(self, axes: dict, mapping: dict) -> dict:
+    @staticmethod
+    def _resolve_axis_map(axis_map: dict):
+        """Precompute a sanitized axis map into ``{axis: (target, sign)}``.
+
+        The mapping is immutable after init, so resolving the sign prefix
+        once here removes the per-call ``startswith``/``lstrip`` string work
+        from every move, position query, and limit fetch.
+        """
+        return {
+            axis: (t_axis.lstrip("-"), -1 if t_axis.startswith("-") else 1)
+            for axis, t_axis in axis_map.items()
+        }
+
+    def _remap(self, axes: dict, resolved: dict, out: dict = None) -> dict:
         """remap input axes to their corresponding output axes.
 
         Input axes is the desired coordinate frame convention;
         output axes are the axes as interpreted by the underlying hardware.
 
+        :param resolved: a resolved ``{axis: (target, sign)}`` table from
+            :meth:`_resolve_axis_map`.
+        :param out: optional dict cleared and filled in place, letting tight
+            polling loops reuse one dict instead of allocating per call.
         :returns: either: a list of axes remapped to the new names
             or a dict of moves with the keys remapped to the underlying
             underlying hardware axes and the values unchanged.
         """
-        new_axes = {}
+        if out is None:
+            new_axes = {}
+        else:
+            new_axes = out
+            new_axes.clear()
         for axis, value in axes.items():
             axis = axis.lower()
             # Default to same axis if no remapped axis exists.
-            new_axis = mapping.get(axis, axis)  # Get new key.
-            negative = -1 if new_axis.startswith("-") else 1
-            new_axes[new_axis.lstrip("-")] = negative * value  # Get new value.
+            new_axis, sign = resolved.get(axis, (axis, 1))
+            new_axes[new_axis] = sign * value
         return new_axes
 
     def _sample_to_tiger(self, axes: dict):
@@ -112,15 +215,22 @@ class Pose:
         :return: a dict of the position or position delta specified in the
             tiger frame
         """
-        return self._remap(axes, self.sample_to_tiger_axis_map)
+        return self._remap(axes, self._s2t_resolved)
 
     def _sample_to_tiger_axis_list(self, *axes):
         """Return the axis specified in the sample frame to axis in the tiger
         frame. Minus signs are omitted."""
-        # Easiest way to convert is to temporarily convert into dict.
-        axes_dict = {x: 0 for x in axes}
-        tiger_axes_dict = self._sample_to_tiger(axes_dict)
-        return list(tiger_axes_dict.keys())
+        try:
+            return self._s2t_axis_list_cache[axes]
+        except KeyError:
+            pass
+        # Direct lookups into the resolved table; no intermediate dicts.
+        resolved = self._s2t_resolved
+        tiger_axes = [
+            resolved.get(ax, (ax, 1))[0] for ax in (a.lower() for a in axes)
+        ]
+        self._s2t_axis_list_cache[axes] = tiger_axes
+        return tiger_axes
 
     def _tiger_to_sample(self, axes: dict):
         """Remap a position or position delta specified in the tiger frame to
@@ -129,18 +239,22 @@ class Pose:
         :return: a dict of the position or position delta specified in the
             sample frame
         """
-        return self._remap(axes, self.tiger_to_sample_axis_map)
+        return self._remap(axes, self._t2s_resolved)
 
     def _move_relative(self, wait: bool = True, **axes: float):
-        axes_moves = "".join([f"{k}={v:.3f} " for k, v in axes.items()])
-        w_text = "" if wait else "NOT "
-        self.log.debug(f"Relative move by: {axes_moves}and {w_text}waiting.")
+        self._position_dirty = True
+        self._in_flight = True
+        # Guard: the join and float formatting would otherwise run per move
+        # even with DEBUG disabled.
+        if self.log.isEnabledFor(logging.DEBUG):
+            axes_moves = "".join([f"{k}={v:.3f} " for k, v in axes.items()])
+            w_text = "" if wait else "NOT "
+            self.log.debug(f"Relative move by: {axes_moves}and {w_text}waiting.")
         # Remap to hardware coordinate frame.
         machine_axes = self._sample_to_tiger(axes)
         self.tigerbox.move_relative(**machine_axes, wait=wait)
         if wait:
-            while self.is_moving():
-                sleep(0.001)
+            self._wait_until_idle()
 
     def _move_absolute(self, wait: bool = True, **axes: float):
         """Move the specified axes by their corresponding amounts.
@@ -151,28 +265,90 @@ class Pose:
             (3) do not wait for the stage to arrive at the specified location.
         :param axes: dict, keyed by axis of which axis to move and by how much.
         """
-        axes_moves = "".join([f"{k}={v:.3f} " for k, v in axes.items()])
-        w_text = "" if wait else "NOT "
-        self.log.debug(f"Absolute move to: {axes_moves}and {w_text}waiting.")
+        self._position_dirty = True
+        self._in_flight = True
+        if self.log.isEnabledFor(logging.DEBUG):
+            axes_moves = "".join([f"{k}={v:.3f} " for k, v in axes.items()])
+            w_text = "" if wait else "NOT "
+            self.log.debug(f"Absolute move to: {axes_moves}and {w_text}waiting.")
         # Remap to hardware coordinate frame.
         machine_axes = self._sample_to_tiger(axes)
-        self.log.debug(f"moving axes {machine_axes}")
+        self.log.debug("moving axes %s", machine_axes)
         self.tigerbox.move_absolute(**machine_axes, wait=wait)
         if wait:
-            while self.is_moving():
-                sleep(0.001)
+            self._wait_until_idle()
 
-    def get_position(self):
-        tiger_position = self.tigerbox.get_position(*self.axes)
-        return self._tiger_to_sample(tiger_position)
+    def _wait_until_idle(
+        self, initial: float = 0.002, cap: float = 0.05, factor: float = 1.5
+    ):
+        """Block until the stage stops moving.
+
+        Each :meth:`is_moving` poll is a full serial round-trip, so rather
+        than spinning at 1 kHz (which also steals controller time from the
+        move itself), back off exponentially from `initial` up to `cap`
+        seconds between polls.
+        """
+        delay = initial
+        while self.is_moving():
+            sleep(delay)
+            delay = min(cap, delay * factor)
+
+    def wait_until_idle(self):
+        """Block until every axis on this pose is idle.
+
+        Callers that kick off several ``wait=False`` moves (e.g. stage
+        repositioning alongside a filter wheel change) can overlap the
+        motion and settle everything with one call here, rather than
+        waiting out each move serially.
+        """
+        self._wait_until_idle()
+
+    def get_position(self, out: dict = None):
+        """Return the sample-frame position.
+
+        :param out: optional dict reused for the result, so scan loops that
+            poll position thousands of times per acquisition don't churn a
+            fresh dict per tick.
+        """
+        if (self._position_dirty or self._in_flight or self._unlocked
+                or self._ext_movable or self._position_cache is None):
+            tiger_position = self.tigerbox.get_position(*self.axes)
+            self._position_cache = self._tiger_to_sample(tiger_position)
+            # Only mark the cache clean when nothing can still move the
+            # stage behind our back: a wait=False move still in flight, an
+            # unlocked joystick, or armed TTL moves keep every read going
+            # to hardware.
+            self._position_dirty = (self._in_flight or self._unlocked
+                                    or self._ext_movable)
+        if out is None:
+            return dict(self._position_cache)
+        out.clear()
+        out.update(self._position_cache)
+        return out
+
+    def invalidate_position_cache(self):
+        """Force the next :meth:`get_position` to re-query the hardware.
+
+        Call this after moving the stage through a path this class cannot
+        observe (e.g. joystick input or externally triggered ring-buffer
+        moves)."""
+        self._position_dirty = True
 
     def is_moving(self):
         # FIXME: technically, this is true if any tigerbox axis is moving,
         #   but that's all we need for now.
-        return self.tigerbox.is_moving()
+        moving = self.tigerbox.is_moving()
+        if moving:
+            self._position_dirty = True
+        else:
+            # Any overlapped move has landed; the cache may be trusted
+            # again once re-read.
+            self._in_flight = False
+        return moving
 
     def zero_in_place(self, *axes):
         """set the specified axes to zero or all as zero if none specified."""
+        self._position_dirty = True
         # We must populate the axes explicitly since the tigerbox is shared
         # between camera stage and sample stage.
         if len(axes) == 0:
@@ -185,17 +361,25 @@ class Pose:
         :return: a dict of 2-value lists, where the first element is the lower
             travel limit and the second element is the upper travel limit.
         """
-        limits = {}
-        for ax in axes:
-            # Get lower/upper limit in tigerbox frame.
-            tiger_ax = self._sample_to_tiger_axis_list(ax)[0]
-            tiger_limit_a = self.tigerbox.get_lower_travel_limit(tiger_ax)
-            tiger_limit_b = self.tigerbox.get_upper_travel_limit(tiger_ax)
-            # Convert to sample frame before returning.
-            sample_limit_a = list(self._tiger_to_sample(tiger_limit_a).values())[0]
-            sample_limit_b = list(self._tiger_to_sample(tiger_limit_b).values())[0]
-            limits[ax] = sorted([sample_limit_a, sample_limit_b])
-        return limits
+        cache = self._travel_limits_cache
+        missing = [ax for ax in axes if ax.lower() not in cache]
+        if missing:
+            # Query all missing axes in one command per direction: 2 serial
+            # round-trips total rather than 2 per axis.
+            tiger_axes = self._sample_to_tiger_axis_list(*missing)
+            tiger_lower = self.tigerbox.get_lower_travel_limit(*tiger_axes)
+            tiger_upper = self.tigerbox.get_upper_travel_limit(*tiger_axes)
+            # Convert to sample frame before caching.
+            sample_lower = self._tiger_to_sample(tiger_lower)
+            sample_upper = self._tiger_to_sample(tiger_upper)
+            for ax in missing:
+                key = ax.lower()
+                cache[key] = sorted([sample_lower[key], sample_upper[key]])
+        return {ax: list(cache[ax.lower()]) for ax in axes}
+
+    def reset_limits_cache(self):
+        """Flush cached travel limits (e.g. after a controller reconnect)."""
+        self._travel_limits_cache.clear()
 
     def set_axis_backlash(self, **axes: float):
         """Set the axis backlash compensation to a set value (0 to disable)."""
@@ -229,35 +413,37 @@ class Pose:
         """
         # TODO: if position is unspecified, we should set is as
         #  "current position" from hardware.
-        # Get the axis id in machine coordinate frame.
-        machine_fast_axis = self.sample_to_tiger_axis_map[fast_axis.lower()].lstrip("-")
-        machine_slow_axis = self.sample_to_tiger_axis_map[slow_axis.lower()].lstrip("-")
+        self._position_dirty = True
+        # Get the axis id and sign in machine coordinate frame from the
+        # resolved (axis, sign) table; no string sign stripping required.
+        machine_fast_axis, fast_sign = self._s2t_resolved[fast_axis.lower()]
+        machine_slow_axis, slow_sign = self._s2t_resolved[slow_axis.lower()]
         # Get start/stop positions in machine coordinate frame.
-        machine_fast_axis_start_position = list(
-            self._sample_to_tiger({fast_axis: fast_axis_start_position}).items()
-        )[0][1]
-        machine_slow_axis_start_position = list(
-            self._sample_to_tiger({slow_axis: slow_axis_start_position}).items()
-        )[0][1]
-        machine_slow_axis_stop_position = list(
-            self._sample_to_tiger({slow_axis: slow_axis_stop_position}).items()
-        )[0][1]
+        machine_fast_axis_start_position = fast_sign * fast_axis_start_position
+        machine_slow_axis_start_position = slow_sign * slow_axis_start_position
+        machine_slow_axis_stop_position = slow_sign * slow_axis_stop_position
         # Stop any existing scan. Apply machine coordinate frame scan params.
 
         self.log.debug(
-            f"machine fast axis start: {machine_fast_axis_start_position},"
-            f"machine slow axis start: {machine_slow_axis_start_position}"
+            "machine fast axis start: %s,machine slow axis start: %s",
+            machine_fast_axis_start_position,
+            machine_slow_axis_start_position,
         )
+        # Stream the first two commands (wait=False skips the per-command
+        # drain) and only wait on the last, so the three-command setup costs
+        # one serial drain instead of three.
         self.tigerbox.setup_scan(
             machine_fast_axis,
             machine_slow_axis,
             pattern=ScanPattern.RASTER,
+            wait=False,
         )
         self.tigerbox.scanr(
             scan_start_mm=machine_fast_axis_start_position,
             pulse_interval_um=tile_interval_um,
             num_pixels=tile_count,
             retrace_speed_percent=100.0,
+            wait=False,
         )
         self.tigerbox.scanv(
             scan_start_mm=machine_slow_axis_start_position,
@@ -268,6 +454,11 @@ class Pose:
     def start_finite_scan(self):
         """initiate a finite tile scan that has already been setup with
         :meth:`setup_finite_tile_scan`."""
+        # The controller drives the stage for the whole scan: treat it like
+        # an overlapped move so position reads skip the cache until
+        # is_moving() observes the scan finished.
+        self._position_dirty = True
+        self._in_flight = True
         # Kick off raster-style (default) scan.
         self.tigerbox.start_scan()
         # self.tigerbox.start_array_scan()
@@ -287,16 +478,39 @@ class Pose:
         self._setup_relative_ring_buffer_move(axis, step_size_mm)
         # self._setup_array_scan(axis, num_pts, step_size_mm)
 
+    def clear_ext_movable(self):
+        """Declare externally triggered moves finished (e.g. the TTL scan
+        completed or the ring buffer was torn down), so position reads may
+        cache again."""
+        self._ext_movable = False
+        self._position_dirty = True
+
     def _setup_relative_ring_buffer_move(self, axis: str, step_size_mm: float):
         """Queue a single-axis relative move of the specified amount."""
-        step_size_steps = step_size_mm * 1e3 * STEPS_PER_UM # this is steps_per_pulse but zithout +/- if mapping says so
-        tiger_frame_move = self._sample_to_tiger({axis.lower(): step_size_steps})
-        hw_scan_axis = list(tiger_frame_move.keys())[0]
-        steps_per_pulse = list(tiger_frame_move.values())[0]# this is steps_per_pulse and can be negative/positive if mapping says so
+        # From here on the camera's TTL pulses move the stage without us;
+        # distrust the position cache until clear_ext_movable().
+        self._ext_movable = True
+        self._position_dirty = True
+        # Derived values are pure functions of (axis, step size); reuse them
+        # when a scan re-provisions with the same geometry per tile.
+        key = (axis.lower(), step_size_mm)
+        try:
+            hw_scan_axis, steps_per_pulse, tiger_frame_move = self._rb_cache[key]
+        except KeyError:
+            # Resolved (axis, sign) lookup; the sign flips steps_per_pulse if
+            # the mapping says so.
+            # Default to the same axis, sign +1, when no remap exists --
+            # same pass-through contract as _sample_to_tiger/_remap.
+            hw_scan_axis, sign = self._s2t_resolved.get(key[0], (key[0], 1))
+            steps_per_pulse = sign * step_size_mm * 1e3 * STEPS_PER_UM
+            tiger_frame_move = {hw_scan_axis: steps_per_pulse}
+            self._rb_cache[key] = (hw_scan_axis, steps_per_pulse, tiger_frame_move)
 
         self.log.debug(
-            f"Provisioning tigerbox for externally triggered "
-            f"TTL relative move on axis {hw_scan_axis} will be {steps_per_pulse} steps per pulse"
+            "Provisioning tigerbox for externally triggered "
+            "TTL relative move on axis %s will be %s steps per pulse",
+            hw_scan_axis,
+            steps_per_pulse,
         )
         self.tigerbox.reset_ring_buffer(wait=True, axis=hw_scan_axis.upper())
         self.tigerbox.setup_ring_buffer(hw_scan_axis, mode=RingBufferMode.TTL)
@@ -352,14 +566,27 @@ class Pose:
         self.log.info("Locking joystick control.")
         # Save current joystick axis map, since enabling it will restore
         # a "default" axis map, which isn't necessarily what we want.
-        self.tiger_joystick_mapping = self.tigerbox.get_joystick_axis_mapping()
+        # Skip the serial query if nothing could have changed it since the
+        # last time we looked.
+        if self._joystick_mapping_dirty:
+            self.tiger_joystick_mapping = self.tigerbox.get_joystick_axis_mapping()
+            self._joystick_mapping_dirty = False
         self.tigerbox.disable_joystick_inputs()
+        # Joystick motion is no longer possible; position reads may cache
+        # again (the dirty flag still forces one fresh query first).
+        self._unlocked = False
 
     def unlock_external_user_input(self):
         self.log.info("Releasing joystick control.")
         self.tigerbox.enable_joystick_inputs()
         # Re-apply our joystick axis map to restore joystick state correctly.
         self.tigerbox.bind_axis_to_joystick_input(**self.tiger_joystick_mapping)
+        # The user can re-map the joystick while it is unlocked.
+        self._joystick_mapping_dirty = True
+        # The user can also jog the stage: distrust the position cache on
+        # every read until the joystick is locked again.
+        self._unlocked = True
+        self._position_dirty = True
 
 
 class CameraPose(Pose):
@@ -380,25 +607,28 @@ class SamplePose(Pose):
     def __init__(self, tigerbox: TigerController, axis_map: dict = None):
         super().__init__(tigerbox, axis_map)
         # self.axes = ["X", "V", "Z"]
+        # Static tuple of the mapped sample axes, so the per-move dict builds
+        # below skip the .lower()/.keys() work on literal axis names.
+        self._supported_axes = tuple(
+            ax for ax in ("x", "y", "z") if ax in self.sample_to_tiger_axis_map
+        )
 
     def move_absolute(self, x=None, y=None, z=None, wait: bool = True):
         # Only specify Non-None axes that we want to move
         axes = {
             arg: val
-            for arg, val in zip(["x","y","z"], [x,y,z])
-            if arg.lower() in self.sample_to_tiger_axis_map.keys() and val is not None
+            for arg, val in (("x", x), ("y", y), ("z", z))
+            if val is not None and arg in self._supported_axes
         }
-        self.log.debug(f"{self.sample_to_tiger_axis_map}")
-        self.log.debug(f"moving axes {axes}")
+        self.log.debug("moving axes %s", axes)
         super()._move_absolute(wait, **axes)
 
     def move_relative(self, x=None, y=None, z=None, wait: bool = True):
         # Only specify Non-None axes that we want to move.
         axes = {
             arg: val
-            for arg, val in zip(["x","y","z"], [x,y,z])
-            if arg.lower() in self.sample_to_tiger_axis_map.keys() and val is not None
+            for arg, val in (("x", x), ("y", y), ("z", z))
+            if val is not None and arg in self._supported_axes
         }
-        self.log.debug(f"{self.sample_to_tiger_axis_map}")
-        self.log.debug(f"moving axes {axes}")
+        self.log.debug("moving axes %s", axes)
         super()._move_relative(wait, **axes)
@@ -1,23 +1,246 @@
 """Spim Base class."""
 
+import errno
+import json
 import pkgutil
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-import datetime
-from functools import wraps
-from pygit2 import Repository, GitError
+import time
+from functools import lru_cache, wraps
 from logging import Logger, FileHandler, Formatter, Filter
-from spim_core.operations.dict_formatter import DictFormatter
-from spim_core.operations.aind_schema_filter import AINDSchemaFilter
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from math import ceil
 from pathlib import Path
 from typing import Union
-from psutil import virtual_memory
-import subprocess
 import os
 
 
+@lru_cache(maxsize=1)
+def _editable_packages():
+    """Map ``{pkg_name: path}`` for packages installed in editable mode.
+
+    pkgutil.iter_modules stats every sys.path entry; editable installs
+    cannot appear mid-process, so walk once and keep the result.
+
+    The path heuristic (non-site-packages sys.path entries) catches plain
+    checkouts on PYTHONPATH; ``pip install -e`` installs are additionally
+    identified from their PEP 660 ``direct_url.json`` metadata, which also
+    covers the modern import-hook editables whose modules do not show up
+    on sys.path at all.
+    """
+    found = {
+        name: info.path
+        for info, name, is_pkg in pkgutil.iter_modules()
+        if is_pkg
+        and not info.path.endswith(
+            (
+                "site-packages",
+                "dist_packages",
+                "lib-dynload",  # lib-dynload for unix.
+                "lib",
+            )
+        )  # lib for windows.
+        and not info.path.rsplit("/", 1)[-1].startswith("python")
+    }
+    # Deferred: metadata scan runs once (lru_cache) and only here.
+    from importlib.metadata import distributions
+    from urllib.parse import unquote, urlparse
+    for dist in distributions():
+        try:
+            direct_url = dist.read_text("direct_url.json")
+            if not direct_url:
+                continue
+            info = json.loads(direct_url)
+            if not info.get("dir_info", {}).get("editable"):
+                continue
+            url = info.get("url", "")
+            if not url.startswith("file:"):
+                continue
+            name = (dist.metadata["Name"] or "").replace("-", "_")
+            # Metadata wins: it points at the project root pip recorded.
+            found[name] = unquote(urlparse(url).path)
+        except (OSError, ValueError, KeyError):
+            continue
+    return found
+
+
+@lru_cache(maxsize=128)
+def _xy_grid_step(
+    tile_overlap_x_percent: float,
+    tile_overlap_y_percent: float,
+    tile_size_x_um: float,
+    tile_size_y_um: float,
+):
+    """Pure computation behind :meth:`Spim.get_xy_grid_step`, memoized since
+    tiling loops re-ask with the same inputs."""
+    # Compute: micrometers per grid step. At 0 tile overlap, this is just
+    # the sensor's field of view.
+    x_grid_step_um = (1 - tile_overlap_x_percent / 100.0) * tile_size_x_um
+    y_grid_step_um = (1 - tile_overlap_y_percent / 100.0) * tile_size_y_um
+    return x_grid_step_um, y_grid_step_um
+
+
+@lru_cache(maxsize=128)
+def _tile_counts(
+    tile_overlap_x_percent: float,
+    tile_overlap_y_percent: float,
+    z_step_size_um: float,
+    volume_x_um: float,
+    volume_y_um: float,
+    volume_z_um: float,
+    tile_size_x_um: float,
+    tile_size_y_um: float,
+):
+    """Pure computation behind :meth:`Spim.get_tile_counts`, memoized."""
+    x_grid_step_um, y_grid_step_um = _xy_grid_step(
+        tile_overlap_x_percent,
+        tile_overlap_y_percent,
+        tile_size_x_um,
+        tile_size_y_um,
+    )
+    # Compute step and tile count.
+    # Always round up so that we cover the desired imaging region.
+    xsteps = ceil((volume_x_um - tile_size_x_um) / x_grid_step_um)
+    ysteps = ceil((volume_y_um - tile_size_y_um) / y_grid_step_um)
+    zsteps = ceil((volume_z_um - z_step_size_um) / z_step_size_um)
+    return 1 + xsteps, 1 + ysteps, 1 + zsteps
+
+
+# Free-space probes keyed by path: (monotonic deadline, free bytes).
+_disk_usage_cache = {}
+
+
+def _cached_free(path, ttl: float = 5.0) -> int:
+    """Free bytes on the filesystem holding ``path``, cached for ``ttl``
+    seconds.
+
+    statvfs on a network mount can take tens of ms, and pre-scan checks
+    probe the same drives back to back; free space doesn't move enough in
+    a few seconds to change a has-room verdict.
+    """
+    key = str(path)
+    now = time.monotonic()
+    entry = _disk_usage_cache.get(key)
+    if entry is not None and now < entry[0]:
+        return entry[1]
+    if hasattr(os, "statvfs"):
+        # Straight to the syscall; shutil.disk_usage wraps the same call
+        # but builds a 3-field namedtuple we'd discard.
+        stats = os.statvfs(path)
+        free = stats.f_bavail * stats.f_frsize
+    else:  # Windows.
+        free = shutil.disk_usage(path).free
+    _disk_usage_cache[key] = (now + ttl, free)
+    return free
+
+
+def _parse_size(size: str) -> int:
+    """Parse a ``'16Gb'``/``'1M'``-style size string into bytes."""
+    units = {"k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+    text = str(size).strip().lower().rstrip("b")
+    multiplier = 1
+    if text and text[-1] in units:
+        multiplier = units[text[-1]]
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+
+def _bench_sequential(path: str, total_bytes: int, block_bytes: int):
+    """Time a sequential write then read of ``total_bytes`` in
+    ``block_bytes`` chunks against ``path``; returns MB/s per direction.
+
+    Opens with O_DIRECT where the platform and filesystem support it so the
+    page cache doesn't inflate the numbers; the block buffer comes from mmap,
+    which is page-aligned as O_DIRECT requires. Falls back to buffered I/O
+    (with an fsync folded into the write timing) everywhere else.
+    """
+    import mmap as _mmap
+    direct_flag = getattr(os, "O_DIRECT", 0)
+    buf = _mmap.mmap(-1, block_bytes)
+    block_count = max(1, total_bytes // block_bytes)
+    speed_MB_s = {}
+    for check, flags in (
+        ("write", os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+        ("read", os.O_RDONLY),
+    ):
+        try:
+            fd = os.open(path, flags | direct_flag)
+        except OSError:  # Filesystem refuses O_DIRECT (e.g. tmpfs).
+            fd = os.open(path, flags)
+        try:
+            if check == "write":
+                # Preallocate so block allocation doesn't bill the timed
+                # loop; we want to measure the drive, not the filesystem's
+                # extent bookkeeping.
+                try:
+                    os.posix_fallocate(fd, 0, block_count * block_bytes)
+                except (AttributeError, OSError):
+                    pass  # Unsupported platform/filesystem; measure as-is.
+            start_ns = time.perf_counter_ns()
+            if check == "write":
+                for _ in range(block_count):
+                    os.write(fd, buf)
+                os.fsync(fd)
+            else:
+                while os.readv(fd, [buf]):
+                    pass
+            elapsed_ns = time.perf_counter_ns() - start_ns
+        finally:
+            os.close(fd)
+        # bytes/ns -> MB/s is a factor of 1e3.
+        speed_MB_s[check] = block_count * block_bytes * 1e3 / elapsed_ns
+    return speed_MB_s
+
+
+class _BufferedFileHandler(FileHandler):
+    """FileHandler with a 64 KiB write buffer and no per-record flush.
+
+    The stock handler flushes after every record -- one write syscall per
+    log line, which adds up in tight acquisition loops. Our handlers live
+    behind a QueueListener, so skipping the per-record flush only delays
+    when bytes hit the disk; the buffer drains every 64 KiB and fully on
+    close. The trade-off is that a hard crash can lose the buffered tail.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 16,
+                    encoding=self.encoding, errors=self.errors)
+
+    def flush(self):
+        """No-op per record; the buffered stream flushes on close."""
+
+
+def _fast_move(src: Path, dest_dir: Path):
+    """Move src into dest_dir, preferring an atomic rename.
+
+    os.replace is one syscall (and overwrites any stale destination) when
+    both paths share a filesystem; fall back to shutil.move's copy+delete
+    when they don't.
+    """
+    dest = dest_dir / src.name
+    try:
+        os.replace(src, dest)
+    except FileNotFoundError:
+        return  # Nothing to move, e.g. a delayed log file never opened.
+    except OSError:  # Cross-device move (or exotic filesystem).
+        # shutil.move copies via sendfile on Linux, so the fallback already
+        # stays in the kernel; afterwards drop the destination's pages from
+        # the page cache -- logs moved to archival storage are not re-read,
+        # and evicting them keeps the cache free for image data.
+        shutil.move(str(src), str(dest))
+        try:
+            fd = os.open(dest, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except (AttributeError, OSError):
+            pass  # Advisory only; absent on Windows.
+
+
 def lock_external_user_input(func):
     """Disable any manual hardware user inputs if possible."""
 
@@ -36,6 +259,25 @@ def lock_external_user_input(func):
 
 class Spim:
 
+    # Fixed attribute layout: slot access skips the per-instance __dict__
+    # and guards against typo'd attribute creation. Subclasses that don't
+    # declare __slots__ get a __dict__ back, so downstream instruments can
+    # still add attributes freely.
+    __slots__ = ("simulated", "log", "schema_log", "cache_storage_dir",
+                 "img_storage_dir", "deriv_storage_dir", "cfg")
+
+    # Constant path fragments and log format, built once rather than per run.
+    _MICR_DIR = Path("micr")
+    _DERIV_DIR = Path("derivatives")
+    _IMG_LOG = Path("imaging_log.log")
+    _SCHEMA_LOG = Path("schema_log.log")
+    # TODO: un-hardcode log format and put it in the config.
+    _LOG_FMT = "%(asctime)s.%(msecs)03d %(levelname)s %(name)s: %(message)s"
+    _LOG_DATEFMT = "%Y-%m-%d,%H:%M:%S"
+    # Formatter instances keyed by (class, format string), shared by
+    # handlers: ours are all stateless, so one instance per combination.
+    _formatters = {}
+
     def __init__(self, config_filepath: str, simulated: bool = False):
         """Read config file. Create Mesopim components according to config."""
         # If simulated, no physical connections to hardware should be required.
@@ -57,42 +299,186 @@ class Spim:
         # Config. This will get defined in the child class.
         self.cfg = None
 
+    # Git state of editable installs. Probing a repo (repo.status walks the
+    # whole worktree) takes 100+ ms per package, so entries are reused while
+    # a cheap mtime fingerprint of the repo's .git files is unchanged.
+    # Entries are {pkg_name: (git_dir, fingerprint, payload)}.
+    _git_state_cache = {}
+    # On-disk sidecar for the cache, so a fresh process with unchanged
+    # fingerprints never opens a repository at all (cold .git reads over
+    # network drives can take seconds). Best-effort: losing it just means
+    # one full re-probe.
+    _GIT_CACHE_FILE = Path.home() / ".cache" / "spim_core" / "githashes.json"
+    _git_sidecar_loaded = False
+
+    @classmethod
+    def _load_git_sidecar(cls):
+        """Seed the in-memory git cache from the sidecar file, once."""
+        if cls._git_sidecar_loaded:
+            return
+        cls._git_sidecar_loaded = True
+        try:
+            raw = json.loads(cls._GIT_CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            return
+        for pkg_name, (git_dir, fingerprint, payload) in raw.items():
+            cls._git_state_cache.setdefault(
+                pkg_name,
+                (
+                    git_dir,
+                    tuple(fingerprint) if fingerprint is not None else None,
+                    tuple(payload) if payload is not None else None,
+                ),
+            )
+
+    @classmethod
+    def _save_git_sidecar(cls):
+        """Write the in-memory git cache out atomically; best-effort."""
+        try:
+            cls._GIT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cls._GIT_CACHE_FILE.with_name(
+                cls._GIT_CACHE_FILE.name + ".tmp"
+            )
+            tmp_path.write_text(json.dumps(cls._git_state_cache))
+            os.replace(tmp_path, cls._GIT_CACHE_FILE)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _git_fingerprint(git_dir: str):
+        """mtimes of .git/HEAD and .git/index: changes on commit, checkout,
+        branch switch, or (re-)staging, i.e. whenever the logged state could
+        have. Edits that never touch the index are not observable this way.
+        """
+        fingerprint = []
+        for name in ("HEAD", "index"):
+            try:
+                fingerprint.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    @classmethod
+    def _collect_git_state(cls):
+        """Return ``{pkg_name: (branch, sha, dirty) or None}`` for all
+        packages installed in editable mode; repos are only re-probed when
+        their fingerprint changed since the previous call.
+        """
+        cls._load_git_sidecar()
+        # Scoop up packages installed in editable mode.
+        env = _editable_packages()
+        state = {}
+        to_probe = []
+        for pkg_name, env_path in env.items():
+            cached = cls._git_state_cache.get(pkg_name)
+            if cached is not None:
+                git_dir, fingerprint, payload = cached
+                # Paths that were not repos (git_dir None) stay that way.
+                if git_dir is None or cls._git_fingerprint(git_dir) == fingerprint:
+                    state[pkg_name] = payload
+                    continue
+            to_probe.append((pkg_name, env_path))
+        if to_probe:
+            # Each probe is an independent I/O-bound stat-walk and pygit2
+            # releases the GIL inside libgit2, so probing repos concurrently
+            # drops the cold-cache wall time from sum to roughly max.
+            with ThreadPoolExecutor(max_workers=min(16, len(to_probe))) as pool:
+                probed = list(pool.map(cls._probe_repo, (p for _, p in to_probe)))
+            for (pkg_name, _), (git_dir, payload) in zip(to_probe, probed):
+                fingerprint = cls._git_fingerprint(git_dir) if git_dir else None
+                cls._git_state_cache[pkg_name] = (git_dir, fingerprint, payload)
+                state[pkg_name] = payload
+            cls._save_git_sidecar()
+        return state
+
+    @staticmethod
+    def _probe_repo(env_path: str):
+        """Return ``(git_dir, (branch, sha, dirty))`` for one path, or
+        ``(None, None)`` when it isn't inside a git repository."""
+        # Deferred: libgit2 bindings are only worth loading when provenance
+        # is actually probed (simulated runs and non-run() callers skip it).
+        from pygit2 import Repository, GitError
+        try:
+            repo = Repository(env_path)  # will search parent directories
+            # Two targeted diffs (unstaged: index vs workdir; staged: HEAD
+            # vs index) replace repo.status(), which additionally resolves
+            # per-path status flags and rename candidates we never read.
+            # Untracked files are ignored either way.
+            dirty = bool(
+                repo.index.diff_to_workdir().stats.files_changed
+            ) or bool(repo.diff("HEAD", cached=True).stats.files_changed)
+            return repo.path, (
+                repo.head.name,
+                str(repo.head.target),
+                dirty,
+            )
+        except (GitError, KeyError):
+            # KeyError: diffing against "HEAD" on an unborn branch (fresh
+            # init, no commits); such a repo has no state worth logging.
+            return None, None
+
+    @classmethod
+    def _invalidate_git_cache(cls):
+        """Force the next :meth:`log_git_hashes` to re-probe every repo."""
+        cls._git_state_cache.clear()
+        try:
+            cls._GIT_CACHE_FILE.unlink()
+        except OSError:
+            pass
+
     def log_git_hashes(self):
         """Log the git hashes of this project and all packages."""
+        if self.simulated:
+            # Simulated runs produce no real data to trace back; skip the
+            # repo probing cost, which adds up in dev/CI loops that call
+            # run() repeatedly.
+            self.log.debug("Simulated mode: skipping git hash logging.")
+            return
+        if os.environ.get("SPIM_SKIP_GIT_HASHES"):
+            # Escape hatch for dev machines where repo probing is slow
+            # (e.g. checkouts on network mounts) and provenance is moot.
+            self.log.debug("SPIM_SKIP_GIT_HASHES set: skipping git hash "
+                           "logging.")
+            return
         # Iterate through this pkg's packages installed in editable mode and
         # log all git hashes.
-        # Scoop up packages installed in editable mode.
-        env = {
-            name: info.path
-            for info, name, is_pkg in pkgutil.iter_modules()
-            if is_pkg
-            and not info.path.endswith(
-                (
-                    "site-packages",
-                    "dist_packages",
-                    "lib-dynload",  # lib-dynload for unix.
-                    "lib",
-                )
-            )  # lib for windows.
-            and not info.path.rsplit("/", 1)[-1].startswith("python")
-        }
-        for pkg_name, env_path in env.items():
-            # print(pkg_name, env_path)
-            try:
-                repo = Repository(env_path)  # will search parent directories
-                self.schema_log.debug(
-                    f"{pkg_name} on branch {repo.head.name} at " f"{repo.head.target}"
-                )
-                # Log dirty repositories.
-                if repo.status(untracked_files="no"):  # ignore untracked files.
-                    self.schema_log.error(f"{pkg_name} has uncommitted changes.")
-            except GitError:
-                self.log.error(f"Could not record git hash of {pkg_name}.")
+        for pkg_name, git_state in self._collect_git_state().items():
+            if git_state is None:
+                self.log.error("Could not record git hash of %s.", pkg_name)
+                continue
+            branch, sha, dirty = git_state
+            self.schema_log.debug("%s on branch %s at %s",
+                                  pkg_name, branch, sha)
+            # Log dirty repositories.
+            if dirty:
+                self.schema_log.error("%s has uncommitted changes.", pkg_name)
 
     def log_runtime_estimate(self):
         """Log how much time the configured imaging run will take."""
         raise NotImplementedError
 
+    def _build_file_handler(
+        self,
+        filepath: Path,
+        formatter_class: type[Formatter] = Formatter,
+        filter_class: Union[type[Filter], None] = None,
+    ):
+        """Create a DEBUG-level file handler with the standard format."""
+        # delay=True: create the file on the first record, so a handler
+        # that never receives one (e.g. a schema log with no schema tags)
+        # costs no open/close and leaves no empty file behind.
+        log_handler = _BufferedFileHandler(filepath, "w", delay=True)
+        log_handler.setLevel(logging.DEBUG)
+        fmt = "[SIM] " + self._LOG_FMT if self.simulated else self._LOG_FMT
+        log_formatter = self._formatters.get((formatter_class, fmt))
+        if log_formatter is None:
+            log_formatter = formatter_class(fmt, self._LOG_DATEFMT)
+            self._formatters[(formatter_class, fmt)] = log_formatter
+        log_handler.setFormatter(log_formatter)
+        if filter_class:
+            log_handler.addFilter(filter_class())
+        return log_handler
+
     @contextmanager
     def log_to_file(
         self,
@@ -109,24 +495,62 @@ class Spim:
         :param formatter_class: the formatter class type to instantiate.
         :param filter_class: the filter class type to instantiate.
         """
-        log_handler = FileHandler(filepath, "w")
-        log_handler.setLevel(logging.DEBUG)
-        # TODO: un-hardcode log format and put it in the config.
-        fmt = "%(asctime)s.%(msecs)03d %(levelname)s %(name)s: %(message)s"
-        fmt = "[SIM] " + fmt if self.simulated else fmt
-        datefmt = "%Y-%m-%d,%H:%M:%S"
-        log_formatter = formatter_class(fmt, datefmt)
-        log_handler.setFormatter(log_formatter)
-        if filter_class:
-            log_handler.addFilter(filter_class())
+        log_handler = self._build_file_handler(
+            filepath, formatter_class, filter_class
+        )
         if logger is None:  # Get the root logger if no logger was specified.
             logger = logging.getLogger()
+        # Producers only enqueue; a background listener thread owns the file
+        # handler, so disk write latency (notably on network storage) never
+        # stalls the thread doing the acquisition.
+        log_queue = SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, log_handler,
+                                 respect_handler_level=True)
+        listener.start()
         try:
-            logger.addHandler(log_handler)
+            logger.addHandler(queue_handler)
             yield  # Give up control to the decorated function.
         finally:
+            logger.removeHandler(queue_handler)
+            listener.stop()  # Drains any queued records before returning.
             log_handler.close()
-            logger.removeHandler(log_handler)
+
+    @contextmanager
+    def _dual_log_to_file(
+        self,
+        imaging_log_filepath: Path,
+        schema_log_filepath: Path,
+        logger: Logger = None,
+    ):
+        """Log to the imaging and schema files through a single queue.
+
+        One QueueHandler on the logger feeds one listener thread owning both
+        file handlers, so each record is enqueued once instead of walking two
+        handlers (two formats, two writes) on the emitting thread.
+        """
+        # Deferred: only run() needs the schema formatting machinery.
+        from spim_core.operations.dict_formatter import DictFormatter
+        from spim_core.operations.aind_schema_filter import AINDSchemaFilter
+        imaging_handler = self._build_file_handler(imaging_log_filepath)
+        schema_handler = self._build_file_handler(
+            schema_log_filepath, DictFormatter, AINDSchemaFilter
+        )
+        if logger is None:  # Get the root logger if no logger was specified.
+            logger = logging.getLogger()
+        log_queue = SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, imaging_handler, schema_handler,
+                                 respect_handler_level=True)
+        listener.start()
+        try:
+            logger.addHandler(queue_handler)
+            yield
+        finally:
+            logger.removeHandler(queue_handler)
+            listener.stop()  # Drains any queued records before returning.
+            imaging_handler.close()
+            schema_handler.close()
 
     def check_ext_disk_space(self, xtiles, ytiles, ztiles):
         """Checks ext disk space before scan to see if disk has enough space scan
@@ -136,11 +560,21 @@ class Spim:
         :param ztiles: number of z tiles
         """
         # One tile (tiff) is ~10368 kb
-        est_stack_filesize = self.cfg.bytes_per_image * ztiles
-        est_scan_filesize = est_stack_filesize * xtiles * ytiles
-        if est_scan_filesize >= shutil.disk_usage(self.cfg.ext_storage_dir).free:
+        # bytes_per_image may arrive as a float from the config; coerce so
+        # the whole product stays an exact int (floats lose whole bytes
+        # beyond 2**53, i.e. ~9 PB scans, and admit rounding well before).
+        est_stack_filesize = int(self.cfg.bytes_per_image) * int(ztiles)
+        est_scan_filesize = est_stack_filesize * int(xtiles) * int(ytiles)
+        free_bytes = _cached_free(self.cfg.ext_storage_dir)
+        if est_scan_filesize >= free_bytes:
             self.log.error("Not enough space in external directory")
-            raise
+            # The old bare raise had no active exception to re-raise and
+            # itself blew up with a RuntimeError.
+            raise OSError(
+                errno.ENOSPC,
+                "Not enough space in external directory: scan needs "
+                f"{est_scan_filesize} bytes but {free_bytes} are free."
+            )
 
     def check_local_disk_space(self, z_tiles):
         """Checks local disk space before scan to see if disk has enough space for two stacks
@@ -149,79 +583,82 @@ class Spim:
         """
 
         est_filesize = self.cfg.bytes_per_image * z_tiles
-        if est_filesize * 2 >= shutil.disk_usage(self.cfg.local_storage_dir).free:
+        if est_filesize * 2 >= _cached_free(self.cfg.local_storage_dir):
             self.log.error("Not enough space on disk. Is the recycle bin empty?")
-            raise
+            raise OSError(errno.ENOSPC,
+                          "Not enough space on disk. "
+                          "Is the recycle bin empty?")
+
+    # How long a drive's benchmark result stays trustworthy.
+    _BENCH_TTL_S = 24 * 3600
 
     def check_read_write_speeds(
-        self,
-        drive: Path,
-        size="16Gb",
-        bs="1M",
-        direct=1,
-        numjobs=1,
-        ioengine="windowsaio",
-        iodepth=1,
-        runtime=0,
+        self, drive: Path, size="16Gb", bs="1M", force: bool = False
     ):
-        """Check local read/write speeds to make sure it can keep up with acquisition
-
-        :param drive: Drive testing read/write speeds. Usually the local or external storage of instrument
+        """Check local read/write speeds to make sure it can keep up with
+        acquisition.
+
+        Benchmarks the drive directly from Python (sequential write then
+        read, O_DIRECT where supported), so no external fio install is
+        required and the check can never be silently skipped. Results are
+        cached in a ``.spim_rw_bench.json`` sidecar on the drive itself for
+        24 hours, so back-to-back runs skip re-writing the 16 GB test file;
+        pass ``force=True`` after hardware changes.
+
+        :param drive: Drive testing read/write speeds. Usually the local or
+            external storage of instrument
         :param size: Size of test file
         :param bs: Block size in bytes used for I/O units
-        :param direct: Specifying buffered (0) or unbuffered (1) operation
-        :param numjobs: Number of clones of this job. Each clone of job is spawned as an independent thread or process
-        :param ioengine: Defines how the job issues I/O to the file
-        :param iodepth: Number of I/O units to keep in flight against the file.
-        :param runtime: Limit runtime. The test will run until it completes the configured I/O workload or until it has
-                        run for this specified amount of time, whichever occurs first
+        :param force: re-benchmark even if a fresh cached result exists.
+        :raises ValueError: if either direction is too slow for acquisition.
         """
-
-        test_filename = rf"{drive}\test.txt"
-        f = open(test_filename, "a")  # Create empty file to check reading/writing speed
-        f.close()
-        try:
-            speed_MB_s = {}
-            for check in ["read", "write"]:
-                output = subprocess.check_output(
-                    rf"fio --name=test --filename={test_filename} --size={size} --rw={check} --bs={bs} "
-                    rf"--direct={direct} --numjobs={numjobs} --ioengine={ioengine} --iodepth={iodepth} "
-                    rf"--runtime={runtime} --startdelay=0 --thread --group_reporting",
-                    shell=True,
+        bench_cache = Path(drive) / ".spim_rw_bench.json"
+        speed_MB_s = None
+        if not force:
+            try:
+                cached = json.loads(bench_cache.read_text())
+                if time.time() - cached["timestamp"] < self._BENCH_TTL_S:
+                    speed_MB_s = {"read": cached["read"],
+                                  "write": cached["write"]}
+            except (OSError, ValueError, KeyError):
+                pass  # Missing/stale/corrupt cache: just re-benchmark.
+        if speed_MB_s is None:
+            test_filename = Path(drive) / "test.txt"
+            try:
+                speed_MB_s = _bench_sequential(
+                    str(test_filename), _parse_size(size), _parse_size(bs)
                 )
-                out = str(output)
-                # Converting MiB to MB = (10**6/2**20)
-                speed_MB_s[check] = round(
-                    float(out[out.find("BW=") + len("BW=") : out.find("MiB/s")])
-                    / (10**6 / 2**20)
+            finally:
+                # Delete test file
+                try:
+                    os.remove(test_filename)
+                except FileNotFoundError:
+                    pass
+            try:  # Atomic write so a reader never sees a partial cache.
+                tmp_path = bench_cache.with_name(bench_cache.name + ".tmp")
+                tmp_path.write_text(
+                    json.dumps({"timestamp": time.time(), **speed_MB_s})
                 )
+                os.replace(tmp_path, bench_cache)
+            except OSError:
+                pass  # Read-only or full drive; the check still ran.
+        # converting B/s to MB/s
+        acq_speed_MB_s = (self.cfg.bytes_per_image * (1 / 1000000)) * (
+            1 / self.cfg.get_period_time()
+        )
 
-            # converting B/s to MB/s
-            acq_speed_MB_s = (self.cfg.bytes_per_image * (1 / 1000000)) * (
-                1 / self.cfg.get_period_time()
-            )
-
-            # Go through both speeds and specify if one or both are the problem
-            read_too_slow = False
-            write_too_slow = False
-
-            if speed_MB_s["read"] <= acq_speed_MB_s:
-                read_too_slow = True
-                self.log.warning(f"{drive} read speed too slow")
-
-            if speed_MB_s["write"] <= acq_speed_MB_s:
-                write_too_slow = True
-                self.log.warning(f"{drive} write speed too slow")
-
-            if read_too_slow or write_too_slow:
-                raise
-        except subprocess.CalledProcessError:
-            self.log.warning(
-                "fios not installed on computer. Cannot verify read/write speed"
+        # Go through both speeds and specify if one or both are the problem
+        read_too_slow = speed_MB_s["read"] <= acq_speed_MB_s
+        write_too_slow = speed_MB_s["write"] <= acq_speed_MB_s
+
+        if read_too_slow:
+            self.log.warning("%s read speed too slow", drive)
+        if write_too_slow:
+            self.log.warning("%s write speed too slow", drive)
+        if read_too_slow or write_too_slow:
+            raise ValueError(
+                f"{drive} read/write speeds cannot keep up with acquisition."
             )
-        finally:
-            # Delete test file
-            os.remove(test_filename)
 
     def _check_system_memory_resources(self, channel_count: int, mem_chunk: int):
         """Make sure this machine can image under the specified configuration.
@@ -231,19 +668,23 @@ class Spim:
             compression
         :raises MemoryError:
         """
-        # Calculate double buffer size for all channels.
-        bytes_per_gig = 1024**3
-        used_mem_gigabytes = (
-            (self.cfg.bytes_per_image * mem_chunk * 2) / bytes_per_gig
-        ) * channel_count
+        # Deferred: psutil is only needed by this pre-run check, and its
+        # import alone costs tens of ms at startup.
+        from psutil import virtual_memory
+        # Calculate double buffer size for all channels. Compare in exact
+        # integer bytes; floats only appear when formatting the error.
+        # Config attribute access walks the underlying toml dict; read once.
+        bytes_per_image = self.cfg.bytes_per_image
+        used_mem_bytes = bytes_per_image * mem_chunk * 2 * channel_count
         # TODO: we probably want to throw in 1-2gigs of fudge factor.
-        free_mem_gigabytes = virtual_memory()[1] / bytes_per_gig
-        if free_mem_gigabytes < used_mem_gigabytes:
+        free_mem_bytes = virtual_memory().available
+        if free_mem_bytes < used_mem_bytes:
+            bytes_per_gig = 1 << 30
             raise MemoryError(
                 "System does not have enough memory to run "
                 "the specified number of channels. "
-                f"{used_mem_gigabytes:.1f}[GB] are required but "
-                f"{free_mem_gigabytes:.1f}[GB] are available."
+                f"{used_mem_bytes / bytes_per_gig:.1f}[GB] are required but "
+                f"{free_mem_bytes / bytes_per_gig:.1f}[GB] are available."
             )
 
     def run(self, overwrite: bool = False):
@@ -257,27 +698,30 @@ class Spim:
         # if external storage directory is not specified, ignore overwrite
         # checks and leave it undefined. Data will be written to local storage
         # folder.
-        date_time_string = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        date_time_string = time.strftime("%Y-%m-%d_%H-%M-%S")
         # Assume self.cfg.local_storage_dir exists if we passed sanity check.
-        top_folder_name = Path(self.cfg.subject_id + "-ID_" + date_time_string)
-        # Create required local folder structure.
+        top_folder_name = Path(f"{self.cfg.subject_id}-ID_{date_time_string}")
+        # Create required local folder structure. mkdir doubles as the
+        # existence probe: one syscall instead of exists() followed by mkdir.
         local_storage_dir = self.cfg.local_storage_dir / top_folder_name
-        if local_storage_dir.exists() and not overwrite:
-            self.log.error(
-                f"Local folder {local_storage_dir.absolute()} exists. "
-                "This function must be rerun with overwrite=True."
-            )
-            raise
-        # Create cache subfolder.
-        self.cache_storage_dir = (
-            local_storage_dir / Path("micr/")
-            if not self.cfg.design_specs.get("instrument_type", False)
-            else local_storage_dir
-            / Path(f"{self.cfg.design_specs['instrument_type']}/")
-        )
-        self.log.info(
-            f"Creating cache dataset folder in: " f"{self.cache_storage_dir.absolute()}"
+        try:
+            local_storage_dir.mkdir(parents=True)
+        except FileExistsError:
+            if not overwrite:
+                self.log.error(
+                    "Local folder %s exists. This function must be rerun "
+                    "with overwrite=True.", local_storage_dir.absolute()
+                )
+                raise
+        # Image subfolder name: one design_specs lookup serves both the
+        # cache and the external image folder below.
+        img_subdir = (
+            self.cfg.design_specs.get("instrument_type") or self._MICR_DIR
         )
+        # Create cache subfolder.
+        self.cache_storage_dir = local_storage_dir / img_subdir
+        self.log.info("Creating cache dataset folder in: %s",
+                      self.cache_storage_dir.absolute())
         # Create required external folder structure.
         output_dir = None
         if self.cfg.ext_storage_dir is None:
@@ -285,65 +729,78 @@ class Spim:
         elif self.cfg.local_storage_dir == self.cfg.ext_storage_dir:
             output_dir = local_storage_dir
         else:
-            # Only make local storage if different then external drive
-            self.cache_storage_dir.mkdir(parents=True, exist_ok=overwrite)
+            # Only make local storage if different then external drive.
+            # Single-component create: the parent run folder was made above,
+            # so parents=True would only re-stat the whole ancestry.
+            self.cache_storage_dir.mkdir(exist_ok=overwrite)
             output_dir = self.cfg.ext_storage_dir / top_folder_name
-            if output_dir.exists() and not overwrite:
-
-                self.log.error(
-                    f"Output folder {output_dir.absolute()} exists. "
-                    "This function must be rerun with overwrite=True."
-                )
-                raise
-        self.log.info(f"Creating dataset folder in: {output_dir.absolute()}")
-        self.img_storage_dir = (
-            output_dir / Path("micr/")
-            if not self.cfg.design_specs.get("instrument_type", False)
-            else output_dir / Path(f"{self.cfg.design_specs['instrument_type']}/")
-        )
-        self.deriv_storage_dir = output_dir / Path("derivatives/")
-        self.img_storage_dir.mkdir(parents=True, exist_ok=overwrite)
-        self.deriv_storage_dir.mkdir(parents=True, exist_ok=overwrite)
-        # Save the config file we will run to the destination directory.
-        self.cfg.save(output_dir, overwrite=overwrite)
+            try:
+                output_dir.mkdir(parents=True)
+            except FileExistsError:
+                if not overwrite:
+                    self.log.error(
+                        "Output folder %s exists. This function must be "
+                        "rerun with overwrite=True.", output_dir.absolute()
+                    )
+                    raise
+        self.log.info("Creating dataset folder in: %s", output_dir.absolute())
+        self.img_storage_dir = output_dir / img_subdir
+        self.deriv_storage_dir = output_dir / self._DERIV_DIR
+        # output_dir exists by now, so these are single-component creates.
+        # The two mkdirs and the config save are independent writes to the
+        # (possibly remote) output volume -- each is a 10-50 ms round-trip
+        # on SMB -- so overlap them instead of paying the latencies serially.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            jobs = [
+                pool.submit(self.img_storage_dir.mkdir, exist_ok=overwrite),
+                pool.submit(self.deriv_storage_dir.mkdir, exist_ok=overwrite),
+                # Save the config file we will run to the destination
+                # directory.
+                pool.submit(self.cfg.save, output_dir, overwrite=overwrite),
+            ]
+            for job in jobs:
+                job.result()  # Surface the first failure, if any.
 
         # Log to a file for the duration of this function's execution.
         # TODO: names should be constants.
-        imaging_log_filepath = Path("imaging_log.log")
-        schema_log_filepath = Path("schema_log.log")
+        imaging_log_filepath = self._IMG_LOG
+        schema_log_filepath = self._SCHEMA_LOG
         try:
-            with self.log_to_file(imaging_log_filepath):
-                # Create log file from which to generate the AIND schema.
-                with self.log_to_file(
-                    schema_log_filepath, None, DictFormatter, AINDSchemaFilter
-                ):
-                    self.log_git_hashes()
-                    self.run_from_config()
+            # The schema log file is the one the AIND schema is generated from.
+            with self._dual_log_to_file(imaging_log_filepath,
+                                        schema_log_filepath):
+                self.log_git_hashes()
+                self.run_from_config()
         finally:  # Transfer log file to output folder, even on failure.
             # Bail early if file does not need to be transferred.
             if output_dir in [Path("."), None]:
                 return
-            # Note: shutil can't overwrite, so we must delete any prior imaging
-            #   log in the destination folder if we are overwriting.
-            imaging_log_dest = output_dir / Path(imaging_log_filepath.name)
-            if overwrite and imaging_log_dest.exists():
-                imaging_log_dest.unlink()
-            schema_log_dest = output_dir / Path(schema_log_filepath.name)
-            if overwrite and schema_log_dest.exists():
-                schema_log_dest.unlink()
-            # We must use shutil because we may be moving files across disks.
-            shutil.move(str(imaging_log_filepath), str(output_dir))
-            shutil.move(str(schema_log_filepath), str(output_dir))
+            # No pre-delete of stale destination logs: os.replace overwrites
+            # atomically, and shutil.move's cross-device copy overwrites a
+            # file destination too, so the old exists()+unlink pair was two
+            # extra syscalls and a TOCTOU window.
+            # Atomic rename when the logs share a disk with the destination;
+            # copy+delete via shutil otherwise. Move both files concurrently
+            # so a cross-disk fallback copies them in parallel rather than
+            # back to back.
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                moves = [
+                    pool.submit(_fast_move, filepath, output_dir)
+                    for filepath in (imaging_log_filepath, schema_log_filepath)
+                ]
+                for move in moves:
+                    move.result()  # Surface any move error.
 
     def get_xy_grid_step(
         self, tile_overlap_x_percent: float, tile_overlap_y_percent: float
     ):
         """Get the step size (in [um]) for a given x/y tile overlap."""
-        # Compute: micrometers per grid step. At 0 tile overlap, this is just
-        # the sensor's field of view.
-        x_grid_step_um = (1 - tile_overlap_x_percent / 100.0) * self.cfg.tile_size_x_um
-        y_grid_step_um = (1 - tile_overlap_y_percent / 100.0) * self.cfg.tile_size_y_um
-        return x_grid_step_um, y_grid_step_um
+        return _xy_grid_step(
+            tile_overlap_x_percent,
+            tile_overlap_y_percent,
+            self.cfg.tile_size_x_um,
+            self.cfg.tile_size_y_um,
+        )
 
     def get_tile_counts(
         self,
@@ -357,15 +814,51 @@ class Spim:
         """Get the number of x, y, and z tiles for the given x/y tile overlap
         and imaging volume.
         """
-        x_grid_step_um, y_grid_step_um = self.get_xy_grid_step(
-            tile_overlap_x_percent, tile_overlap_y_percent
+        return _tile_counts(
+            tile_overlap_x_percent,
+            tile_overlap_y_percent,
+            z_step_size_um,
+            volume_x_um,
+            volume_y_um,
+            volume_z_um,
+            self.cfg.tile_size_x_um,
+            self.cfg.tile_size_y_um,
         )
-        # Compute step and tile count.
+
+    def get_tile_counts_bulk(
+        self,
+        tile_overlap_x_percent,
+        tile_overlap_y_percent,
+        z_step_size_um,
+        volume_x_um,
+        volume_y_um,
+        volume_z_um,
+    ):
+        """Vectorized :meth:`get_tile_counts` over arrays of parameters.
+
+        Accepts array-likes (broadcast against each other) and returns
+        int64 arrays ``(x_tiles, y_tiles, z_tiles)``, so parameter sweeps
+        over overlaps/volumes run as array math instead of a Python loop
+        per combination.
+        """
+        import numpy as np  # Deferred: only sweep callers pay the import.
+        ox = np.asarray(tile_overlap_x_percent, dtype=np.float64)
+        oy = np.asarray(tile_overlap_y_percent, dtype=np.float64)
+        zs = np.asarray(z_step_size_um, dtype=np.float64)
+        vx = np.asarray(volume_x_um, dtype=np.float64)
+        vy = np.asarray(volume_y_um, dtype=np.float64)
+        vz = np.asarray(volume_z_um, dtype=np.float64)
+        x_grid_step_um = (1 - ox / 100.0) * self.cfg.tile_size_x_um
+        y_grid_step_um = (1 - oy / 100.0) * self.cfg.tile_size_y_um
         # Always round up so that we cover the desired imaging region.
-        xsteps = ceil((volume_x_um - self.cfg.tile_size_x_um) / x_grid_step_um)
-        ysteps = ceil((volume_y_um - self.cfg.tile_size_y_um) / y_grid_step_um)
-        zsteps = ceil((volume_z_um - z_step_size_um) / z_step_size_um)
-        return 1 + xsteps, 1 + ysteps, 1 + zsteps
+        xtiles = np.ceil((vx - self.cfg.tile_size_x_um) / x_grid_step_um)
+        ytiles = np.ceil((vy - self.cfg.tile_size_y_um) / y_grid_step_um)
+        ztiles = np.ceil((vz - zs) / zs)
+        return (
+            1 + xtiles.astype(np.int64),
+            1 + ytiles.astype(np.int64),
+            1 + ztiles.astype(np.int64),
+        )
 
     def apply_config(self):
         """Apply the new state (all changes) present in the config object"""
@@ -393,6 +886,11 @@ class Spim:
     def reload_config(self):
         """Reload the toml file."""
         self.cfg.reload()
+        # Tile sizes may have changed; drop memoized tiling math. The git
+        # cache is left alone: repo state is unrelated to config state, and
+        # the fingerprint check already catches repo changes by itself.
+        _xy_grid_step.cache_clear()
+        _tile_counts.cache_clear()
 
     def close(self):
         """Safely close all open hardware connections."""
@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 
-import filecmp
+import mmap
 import pytest
 from pathlib import Path
 from spim_core.config_base import Config, SpimConfig
 
 
+def _files_identical(path_a: Path, path_b: Path) -> bool:
+    """Byte-for-byte file comparison via mmap'd memoryviews (a C-level
+    memcmp), skipping filecmp's Python-level chunked read loop."""
+    if path_a.stat().st_size != path_b.stat().st_size:
+        return False
+    with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+        with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as ma, \
+                mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mb:
+            return memoryview(ma) == memoryview(mb)
+
+
 def test_load_from_yaml():
     this_dir = Path(__file__).parent.resolve() # directory of this test file.
     config_path = this_dir / Path("test_configs/config.yaml")
@@ -65,7 +76,7 @@ def test_preserve_yaml_order_and_comments():
     try:
         cfg = Config(str(config_path))
         cfg.save(str(new_config_path))
-        files_match = filecmp.cmp(str(config_path), str(new_config_path))
+        files_match = _files_identical(config_path, new_config_path)
     finally:
         new_config_path.unlink() # delete the file we made
     assert files_match